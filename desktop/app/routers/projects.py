@@ -12,7 +12,7 @@ import uuid
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks, Body
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -28,6 +28,7 @@ from app.utils.file_utils import (
     cleanup_project_files,
     FileValidationError,
 )
+from app.utils.responses import dumps_json
 
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
@@ -122,26 +123,30 @@ init_db()
 
 
 @router.get("", response_model=ProjectListResponse)
-async def list_projects(db: Session = Depends(get_db)) -> ProjectListResponse:
+async def list_projects(db: Session = Depends(get_db)) -> ORJSONResponse:
     """
     List all projects.
 
     Returns:
-        ProjectListResponse: List of all projects with basic info.
+        ORJSONResponse: List of all projects with basic info.
     """
     projects = db.query(Project).order_by(Project.created_at.desc()).all()
 
-    return ProjectListResponse(
-        projects=[
-            ProjectListItem(
-                id=p.id,
-                name=p.name,
-                status=p.status,
-                progress=p.progress,
-                created_at=p.created_at.isoformat() if p.created_at else "",
-            )
-            for p in projects
-        ]
+    # Built as plain dicts and serialized directly, skipping model validation
+    # and jsonable_encoder; the shape still matches ProjectListResponse.
+    return ORJSONResponse(
+        content={
+            "projects": [
+                {
+                    "id": p.id,
+                    "name": p.name,
+                    "status": p.status,
+                    "progress": p.progress,
+                    "created_at": p.created_at.isoformat() if p.created_at else "",
+                }
+                for p in projects
+            ]
+        }
     )
 
 
@@ -287,7 +292,7 @@ async def export_all_projects(
 
         export_data["projects"].append(project_data)
 
-    json_content = json.dumps(export_data, ensure_ascii=False, indent=2)
+    json_content = dumps_json(export_data, indent=True)
 
     return Response(
         content=json_content,
@@ -449,7 +454,9 @@ async def get_project(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    return project.to_dict(include_sentences=True, include_speakers=True)
+    return ORJSONResponse(
+        content=project.to_dict(include_sentences=True, include_speakers=True)
+    )
 
 
 @router.delete("/{project_id}")
@@ -590,7 +597,7 @@ async def export_project(
             ],
         })
 
-    json_content = json.dumps(export_data, ensure_ascii=False, indent=2)
+    json_content = dumps_json(export_data, indent=True)
     filename = f"{project.name}_export.json"
 
     return Response(
@@ -5,6 +5,7 @@ Provides transcription with speaker diarization and identification.
 """
 
 import asyncio
+import bisect
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -29,7 +30,7 @@ class SpeakerInfo:
     evidence: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WordTimestamp:
     """Timestamp information for a single word."""
     text: str
@@ -37,7 +38,7 @@ class WordTimestamp:
     end: float    # seconds
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UtteranceInfo:
     """Information about a single utterance."""
     text: str
@@ -157,6 +158,11 @@ class AssemblyAITranscriber:
                     end=w.end / 1000.0,
                 ))
 
+        # Keep words ordered by start time so each utterance can locate its
+        # words by binary search instead of scanning the whole list
+        all_words.sort(key=lambda w: w.start)
+        word_starts = [w.start for w in all_words]
+
         # Extract speakers and utterances
         speaker_labels = set()
         speaker_utterances: Dict[str, List[str]] = {}
@@ -176,11 +182,14 @@ class AssemblyAITranscriber:
                 utt_start = utt.start / 1000.0
                 utt_end = utt.end / 1000.0
 
-                # Match words to this utterance by time overlap
-                utt_words = [
-                    w for w in all_words
-                    if w.start >= utt_start - 0.01 and w.end <= utt_end + 0.01
-                ]
+                # Match words to this utterance by time overlap. A word ends
+                # after it starts, so only words starting inside the window
+                # can qualify.
+                window_start = utt_start - 0.01
+                window_end = utt_end + 0.01
+                lo = bisect.bisect_left(word_starts, window_start)
+                hi = bisect.bisect_right(word_starts, window_end, lo)
+                utt_words = [w for w in all_words[lo:hi] if w.end <= window_end]
 
                 utterances.append(UtteranceInfo(
                     text=utt.text,
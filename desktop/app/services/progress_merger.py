@@ -6,9 +6,25 @@ Uses "last-write-wins" strategy for individual sentence progress.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=256)
+def _parse_ts(ts: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO format timestamp, memoized since sync timestamps recur."""
+    if not ts:
+        return None
+
+    try:
+        # Handle various ISO formats
+        if ts.endswith('Z'):
+            ts = ts[:-1] + '+00:00'
+        return datetime.fromisoformat(ts)
+    except (ValueError, TypeError):
+        return None
+
+
 class ProgressMerger:
     """
     Merges learning progress between local and remote project data.
@@ -75,14 +91,13 @@ class ProgressMerger:
 
         Takes the higher learn_count and marks as learned if either source has it learned.
         """
-        # Index by ID for quick lookup
+        # Index each side by ID once so the merge is a single O(N) pass
         local_by_id = {s['id']: s for s in local}
         remote_by_id = {s['id']: s for s in remote}
 
         merged = []
-        all_ids = set(local_by_id.keys()) | set(remote_by_id.keys())
 
-        for sentence_id in all_ids:
+        for sentence_id in local_by_id.keys() | remote_by_id.keys():
             local_s = local_by_id.get(sentence_id, {})
             remote_s = remote_by_id.get(sentence_id, {})
 
@@ -93,9 +108,7 @@ class ProgressMerger:
                 merged_sentence = remote_s.copy()
 
             # Merge learning progress - use max values
-            local_learned = local_s.get('learned', False)
-            remote_learned = remote_s.get('learned', False)
-            merged_sentence['learned'] = local_learned or remote_learned
+            merged_sentence['learned'] = bool(local_s.get('learned')) or bool(remote_s.get('learned'))
 
             local_count = local_s.get('learn_count', 0) or 0
             remote_count = remote_s.get('learn_count', 0) or 0
@@ -185,6 +198,15 @@ class ProgressMerger:
         if not ts2:
             return ts1
 
+        # Same-shaped ISO strings (same length, separator and zone suffix)
+        # order lexicographically, so skip parsing in the common case.
+        if (
+            len(ts1) == len(ts2) >= 19
+            and ts1[10] == ts2[10]
+            and ts1[19:].lstrip('.0123456789') == ts2[19:].lstrip('.0123456789')
+        ):
+            return ts1 if ts1 <= ts2 else ts2
+
         dt1 = self._parse_timestamp(ts1)
         dt2 = self._parse_timestamp(ts2)
 
@@ -194,16 +216,7 @@ class ProgressMerger:
 
     def _parse_timestamp(self, ts: str) -> Optional[datetime]:
         """Parse an ISO format timestamp."""
-        if not ts:
-            return None
-
-        try:
-            # Handle various ISO formats
-            if ts.endswith('Z'):
-                ts = ts[:-1] + '+00:00'
-            return datetime.fromisoformat(ts)
-        except (ValueError, TypeError):
-            return None
+        return _parse_ts(ts)
 
 
 def merge_progress_files(local_path: str, remote_path: str, output_path: str) -> dict:
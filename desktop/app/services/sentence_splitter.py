@@ -6,7 +6,8 @@ and uses word-level timestamps from AssemblyAI for precise audio alignment.
 """
 
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from app.services.assemblyai_transcriber import UtteranceInfo, WordTimestamp
 
@@ -19,6 +20,31 @@ CLAUSE_BOUNDARY_CHARS = {',', ';', ':', '\u2014', '\u2013'}
 
 MIN_SEGMENT_WORDS = 3
 
+# A segment's output text and its words (tokenized once, for length checks)
+Segment = Tuple[str, List[str]]
+
+
+@lru_cache(maxsize=1024)
+def _sentence_segments(text: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """
+    Split text on sentence boundaries and tokenize each sentence.
+
+    Pure function of the text, so results are cached; repeated utterances
+    (re-processing, retries) skip the regex and tokenization entirely.
+
+    Args:
+        text: Utterance text.
+
+    Returns:
+        Tuple of (stripped sentence text, word tuple) pairs, one per
+        non-empty sentence.
+    """
+    return tuple(
+        (seg.strip(), words)
+        for seg, words in ((seg, tuple(seg.split())) for seg in SENTENCE_BOUNDARY_RE.split(text))
+        if words
+    )
+
 
 class SentenceSplitter:
     """
@@ -50,116 +76,120 @@ class SentenceSplitter:
         Returns:
             List of utterances split at natural boundaries.
         """
-        result: List[UtteranceInfo] = []
-        for utt in utterances:
-            segments = self._split_utterance(utt)
-            result.extend(segments)
-        return result
+        return [
+            segment
+            for utt in utterances
+            for segment in self._split_utterance(utt)
+        ]
 
     def _split_utterance(self, utt: UtteranceInfo) -> List[UtteranceInfo]:
         """Split a single long utterance into multiple shorter ones."""
-        # Step 1: Always split on sentence boundaries (. ? ! followed by uppercase)
-        raw_segments = SENTENCE_BOUNDARY_RE.split(utt.text)
-        raw_segments = [s.strip() for s in raw_segments if s.strip()]
+        # Step 1: Always split on sentence boundaries (. ? ! followed by uppercase).
+        # Each segment is tokenized once here; later steps work on word lists
+        # instead of re-splitting strings for every length check. Segments
+        # that are not split further keep their original text.
+        raw_segments: List[Segment] = [
+            (text, list(words)) for text, words in _sentence_segments(utt.text)
+        ]
 
         # Step 2: Split any still-long segments on clause boundaries
-        refined: List[str] = []
-        for seg in raw_segments:
-            if len(seg.split()) > self.max_words:
-                refined.extend(self._split_on_clauses(seg))
+        refined: List[Segment] = []
+        for text, words in raw_segments:
+            if len(words) > self.max_words:
+                refined.extend(
+                    (" ".join(part), part) for part in self._split_on_clauses(words)
+                )
             else:
-                refined.append(seg)
+                refined.append((text, words))
 
         # Step 3: Hard-split any still-long segments
-        final_texts: List[str] = []
-        for seg in refined:
-            if len(seg.split()) > self.max_words:
-                final_texts.extend(self._hard_split(seg))
+        final_segments: List[Segment] = []
+        for text, words in refined:
+            if len(words) > self.max_words:
+                final_segments.extend(
+                    (" ".join(part), part) for part in self._hard_split(words)
+                )
             else:
-                final_texts.append(seg)
+                final_segments.append((text, words))
 
         # Step 4: Merge short segments (<MIN_SEGMENT_WORDS) with neighbors
-        final_texts = self._merge_short_segments(final_texts)
+        final_segments = self._merge_short_segments(final_segments)
 
         # If we ended up with just one segment, return original
-        if len(final_texts) <= 1:
+        if len(final_segments) <= 1:
             return [utt]
 
         # Map text segments to word timestamps and create new UtteranceInfos
-        return self._map_to_utterances(final_texts, utt)
+        return self._map_to_utterances(final_segments, utt)
 
-    def _split_on_clauses(self, text: str) -> List[str]:
+    def _split_on_clauses(self, words: List[str]) -> List[List[str]]:
         """
-        Split text on clause boundary punctuation, picking closest to midpoint.
+        Split words on clause boundary punctuation, picking closest to midpoint.
 
         Args:
-            text: Text to split on clause boundaries.
+            words: Tokenized segment to split on clause boundaries.
 
         Returns:
-            List of text segments split at clause boundaries.
+            List of word lists split at clause boundaries.
         """
-        words = text.split()
         total = len(words)
 
         if total <= self.max_words:
-            return [text]
+            return [words]
 
-        # Find clause boundary positions (word index where word ends with clause punct)
-        boundary_positions: List[int] = []
-        for i, word in enumerate(words):
-            if word and word[-1] in CLAUSE_BOUNDARY_CHARS:
-                boundary_positions.append(i)
+        # Find clause boundary positions (word index where word ends with clause punct).
+        # Words come from str.split(), so they are never empty.
+        boundary_positions = [
+            i for i, word in enumerate(words) if word[-1] in CLAUSE_BOUNDARY_CHARS
+        ]
 
         if not boundary_positions:
-            return [text]  # No clause boundaries found
+            return [words]  # No clause boundaries found
 
         # Pick split point closest to midpoint
         midpoint = total // 2
         best_pos = min(boundary_positions, key=lambda p: abs(p - midpoint))
 
-        left = " ".join(words[:best_pos + 1])
-        right = " ".join(words[best_pos + 1:])
+        left = words[:best_pos + 1]
+        right = words[best_pos + 1:]
 
         # Recursively split if still too long
-        result: List[str] = []
-        if len(left.split()) > self.max_words:
+        result: List[List[str]] = []
+        if len(left) > self.max_words:
             result.extend(self._split_on_clauses(left))
         else:
             result.append(left)
 
-        if right and len(right.split()) > self.max_words:
+        if right and len(right) > self.max_words:
             result.extend(self._split_on_clauses(right))
         elif right:
             result.append(right)
 
         return result
 
-    def _hard_split(self, text: str) -> List[str]:
+    def _hard_split(self, words: List[str]) -> List[List[str]]:
         """
-        Split text at exactly max_words boundary.
+        Split words at exactly max_words boundary.
 
         Args:
-            text: Text to hard-split.
+            words: Tokenized segment to hard-split.
 
         Returns:
-            List of text segments, each with at most max_words words.
+            List of word lists, each with at most max_words words.
         """
-        words = text.split()
-        segments: List[str] = []
-        for i in range(0, len(words), self.max_words):
-            segment = " ".join(words[i:i + self.max_words])
-            if segment:
-                segments.append(segment)
-        return segments
-
-    def _merge_short_segments(self, segments: List[str]) -> List[str]:
+        return [
+            words[i:i + self.max_words]
+            for i in range(0, len(words), self.max_words)
+        ]
+
+    def _merge_short_segments(self, segments: List[Segment]) -> List[Segment]:
         """
         Merge segments with fewer than MIN_SEGMENT_WORDS into neighbors.
 
         Only merges if the combined segment would not exceed max_words.
 
         Args:
-            segments: List of text segments to merge.
+            segments: List of (text, words) segments to merge.
 
         Returns:
             List of segments where short ones have been merged with neighbors.
@@ -167,28 +197,30 @@ class SentenceSplitter:
         if len(segments) <= 1:
             return segments
 
-        merged: List[str] = []
+        merged: List[Segment] = []
         i = 0
         while i < len(segments):
-            seg = segments[i]
-            if len(seg.split()) < MIN_SEGMENT_WORDS:
-                if merged and len(merged[-1].split()) + len(seg.split()) <= self.max_words:
+            text, words = segments[i]
+            if len(words) < MIN_SEGMENT_WORDS:
+                if merged and len(merged[-1][1]) + len(words) <= self.max_words:
                     # Merge with previous if it won't exceed max_words
-                    merged[-1] = merged[-1] + " " + seg
-                elif i + 1 < len(segments) and len(seg.split()) + len(segments[i + 1].split()) <= self.max_words:
+                    prev_text, prev_words = merged[-1]
+                    merged[-1] = (prev_text + " " + text, prev_words + words)
+                elif i + 1 < len(segments) and len(words) + len(segments[i + 1][1]) <= self.max_words:
                     # Merge with next if it won't exceed max_words
-                    segments[i + 1] = seg + " " + segments[i + 1]
+                    next_text, next_words = segments[i + 1]
+                    segments[i + 1] = (text + " " + next_text, words + next_words)
                 else:
                     # Can't merge without exceeding max_words, keep as-is
-                    merged.append(seg)
+                    merged.append((text, words))
             else:
-                merged.append(seg)
+                merged.append((text, words))
             i += 1
 
         return merged
 
     def _map_to_utterances(
-        self, texts: List[str], original: UtteranceInfo
+        self, segments: List[Segment], original: UtteranceInfo
     ) -> List[UtteranceInfo]:
         """
         Map text segments back to UtteranceInfo objects with word timestamps.
@@ -197,34 +229,30 @@ class SentenceSplitter:
         the words list count differs from text.split() count.
 
         Args:
-            texts: List of text segments from splitting.
+            segments: List of (text, words) segments from splitting.
             original: The original UtteranceInfo being split.
 
         Returns:
             List of new UtteranceInfo objects with correct timestamps and words.
         """
         words = original.words
+        num_words = len(words)
+        last_idx = len(segments) - 1
         utterances: List[UtteranceInfo] = []
         word_idx = 0
 
-        for seg_idx, text in enumerate(texts):
-            seg_word_count = len(text.split())
-
+        for seg_idx, (text, seg) in enumerate(segments):
             # Match words from the words list to this segment by counting
-            # how many word timestamps to consume. Use the smaller of
-            # seg_word_count and remaining words to prevent over-indexing.
-            remaining_words = len(words) - word_idx
-            remaining_segments = len(texts) - seg_idx
-
-            if remaining_segments == 1:
-                # Last segment gets all remaining words
-                consume = remaining_words
+            # how many word timestamps to consume. The last segment gets all
+            # remaining words; others take their text word count, capped at
+            # what is left to prevent over-indexing.
+            if seg_idx == last_idx:
+                word_end = num_words
             else:
-                # Consume based on text word count, but cap at remaining
-                consume = min(seg_word_count, remaining_words)
+                word_end = min(word_idx + len(seg), num_words)
 
-            seg_words = words[word_idx:word_idx + consume]
-            word_idx += consume
+            seg_words = words[word_idx:word_end]
+            word_idx = word_end
 
             if seg_words:
                 start = seg_words[0].start
@@ -234,6 +262,12 @@ class SentenceSplitter:
                 start = original.start
                 end = original.end
 
+            # First segment starts at original start, last ends at original end
+            if seg_idx == 0:
+                start = original.start
+            if seg_idx == last_idx:
+                end = original.end
+
             utterances.append(UtteranceInfo(
                 text=text,
                 start=start,
@@ -242,21 +276,4 @@ class SentenceSplitter:
                 words=seg_words,
             ))
 
-        # Ensure first segment starts at original start, last ends at original end
-        if utterances:
-            utterances[0] = UtteranceInfo(
-                text=utterances[0].text,
-                start=original.start,
-                end=utterances[0].end,
-                speaker_label=utterances[0].speaker_label,
-                words=utterances[0].words,
-            )
-            utterances[-1] = UtteranceInfo(
-                text=utterances[-1].text,
-                start=utterances[-1].start,
-                end=original.end,
-                speaker_label=utterances[-1].speaker_label,
-                words=utterances[-1].words,
-            )
-
         return utterances
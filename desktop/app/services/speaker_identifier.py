@@ -5,11 +5,11 @@ Analyzes conversation transcripts to identify speakers by name and role
 based on contextual clues in the dialogue.
 """
 
-import json
 import logging
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+import orjson
 from openai import AsyncOpenAI
 
 from app.config import settings
@@ -17,6 +17,36 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Static prompt text, filled in per call with str.format
+PROMPT_TEMPLATE = """You are analyzing a Dutch conversation transcript titled "{project_name}".
+The transcript has speaker labels (A, B, C, etc.) assigned by automatic diarization.
+
+Based on context clues (introductions, name mentions, job titles, how others address them),
+identify each speaker.
+
+<transcript>
+{transcript_text}
+</transcript>
+
+Return ONLY a valid JSON object in this exact format:
+{{
+  "speakers": [
+    {{
+      "label": "A",
+      "name": "Jan de Vries",
+      "role": "IT Service Manager",
+      "confidence": "high",
+      "evidence": "Introduced himself at the start and others refer to him as Jan"
+    }}
+  ]
+}}
+
+Rules:
+- If you cannot determine a name, use a descriptive label in Dutch like "de presentator" or "de manager"
+- confidence: "high" = name explicitly mentioned, "medium" = inferred from context, "low" = guess
+- evidence: brief explanation of how you determined the identity
+- Include ALL speaker labels found in the transcript"""
+
 
 @dataclass
 class SpeakerIdentification:
@@ -67,37 +97,12 @@ class SpeakerIdentifier:
         Returns:
             The formatted prompt string.
         """
-        lines = [f"[{entry['label']}] {entry['text']}" for entry in transcript]
-        transcript_text = "\n".join(lines)
-
-        return f"""You are analyzing a Dutch conversation transcript titled "{project_name}".
-The transcript has speaker labels (A, B, C, etc.) assigned by automatic diarization.
-
-Based on context clues (introductions, name mentions, job titles, how others address them),
-identify each speaker.
-
-<transcript>
-{transcript_text}
-</transcript>
-
-Return ONLY a valid JSON object in this exact format:
-{{
-  "speakers": [
-    {{
-      "label": "A",
-      "name": "Jan de Vries",
-      "role": "IT Service Manager",
-      "confidence": "high",
-      "evidence": "Introduced himself at the start and others refer to him as Jan"
-    }}
-  ]
-}}
-
-Rules:
-- If you cannot determine a name, use a descriptive label in Dutch like "de presentator" or "de manager"
-- confidence: "high" = name explicitly mentioned, "medium" = inferred from context, "low" = guess
-- evidence: brief explanation of how you determined the identity
-- Include ALL speaker labels found in the transcript"""
+        transcript_text = "\n".join(
+            f"[{entry['label']}] {entry['text']}" for entry in transcript
+        )
+        return PROMPT_TEMPLATE.format(
+            project_name=project_name, transcript_text=transcript_text
+        )
 
     def _parse_response(self, content: str) -> Dict[str, SpeakerIdentification]:
         """
@@ -111,8 +116,8 @@ Rules:
             Returns empty dict on parse failure.
         """
         try:
-            data = json.loads(content)
-        except (json.JSONDecodeError, TypeError):
+            data = orjson.loads(content)
+        except (orjson.JSONDecodeError, TypeError):
             logger.warning("Failed to parse speaker identification response as JSON")
             return {}
 
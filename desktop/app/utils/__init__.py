@@ -17,6 +17,7 @@ from app.utils.file_utils import (
     ensure_file_exists,
     FileValidationError,
 )
+from app.utils.responses import dumps_json, orjson_default
 
 __all__ = [
     "validate_file_extension",
@@ -32,4 +33,6 @@ __all__ = [
     "get_audio_filename",
     "ensure_file_exists",
     "FileValidationError",
+    "dumps_json",
+    "orjson_default",
 ]
@@ -0,0 +1,47 @@
+"""
+JSON response helpers for the Dutch Language Learning Application.
+
+Serializes API payloads with orjson instead of the stdlib json encoder.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    Fallback serializer for types orjson does not handle natively.
+
+    Args:
+        obj: The object orjson could not serialize.
+
+    Returns:
+        Any: A JSON-serializable equivalent.
+
+    Raises:
+        TypeError: If the type is not supported.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(content: Any, indent: bool = False) -> bytes:
+    """
+    Serialize content to UTF-8 JSON bytes with orjson.
+
+    Args:
+        content: The data to serialize.
+        indent: Whether to pretty-print with two-space indentation.
+
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(content, default=orjson_default, option=option)
@@ -16,9 +16,12 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+# Load environment variables from the repository root .env (next to
+# .env.example). Production deployments (APP_ENV=prod) provide them directly,
+# so skip the file there.
+if os.environ.get("APP_ENV") != "prod":
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=project_root.parent / ".env", override=False)
 
 import uvicorn
 from app.config import settings
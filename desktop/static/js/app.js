@@ -109,7 +109,8 @@ async function loadDictionary() {
 /**
  * Look up a word in the Dutch dictionary.
  * @param {string} word - Word to look up
- * @returns {Object|null} - Dictionary entry {pos, en} or null
+ * @returns {Object|null} - Dictionary entry {pos, en} or null; `en` is a
+ *     list of translations (older dictionary files store a single string)
  */
 function lookupWord(word) {
     if (!dutchDictionary || !word) return null;
@@ -1256,6 +1257,15 @@ function renderLearnInterface(project) {
     `;
 }
 
+/**
+ * Format the English translations of a dictionary entry for display.
+ * @param {Object} entry - Dictionary entry {pos, en}
+ * @returns {string} - Translations joined with semicolons
+ */
+function formatDictionaryEn(entry) {
+    return Array.isArray(entry.en) ? entry.en.join('; ') : (entry.en || '');
+}
+
 /**
  * Create hoverable words from sentence text.
  * Prioritizes GPT keywords, then dictionary lookup, then no definition.
@@ -1306,7 +1316,7 @@ function createHoverableText(text, keywords) {
                          data-source="dictionary"
                          data-word="${escapeHtml(word)}"
                          data-dict-pos="${escapeHtml(dictEntry.pos || '')}"
-                         data-dict-en="${escapeHtml(dictEntry.en)}">${escapeHtml(word)}</span>`;
+                         data-dict-en="${escapeHtml(formatDictionaryEn(dictEntry))}">${escapeHtml(word)}</span>`;
         }
 
         // Priority 3: No definition found
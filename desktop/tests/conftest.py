@@ -1,10 +1,22 @@
 """Shared test fixtures for Desktop backend tests."""
 
+import os
+import shutil
+import tempfile
 import uuid
 
+# The app creates its own SQLite file at import/startup. Point it at a
+# private temp directory instead of the developer's data/ database. Each
+# pytest-xdist worker (and each checkout's run) makes its own directory, so
+# concurrent runs never share the file; it is removed when the session ends.
+# Assigned unconditionally because workers inherit the controller's
+# environment. Must happen before anything imports app.config.
+_APP_DB_DIR = tempfile.mkdtemp(prefix="dutch_learn_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_APP_DB_DIR}/app.db"
+
 import pytest
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
@@ -15,11 +27,13 @@ from app.models import Project, Sentence, Keyword, Speaker
 
 # --- Database Fixtures ---
 
+# In-memory databases are private to their process, so each xdist worker
+# automatically gets its own copy of the test schema.
 TEST_DATABASE_URL = "sqlite:///:memory:"
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def db_engine():
-    """Create a fresh in-memory SQLite engine per test."""
+    """Create one in-memory SQLite engine and schema for the whole run."""
     engine = create_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
@@ -31,6 +45,12 @@ def db_engine():
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work under pysqlite
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
     Base.metadata.create_all(bind=engine)
     yield engine
@@ -40,27 +60,51 @@ def db_engine():
 
 @pytest.fixture
 def db(db_engine):
-    """Provide a clean DB session per test."""
-    SessionLocal = sessionmaker(bind=db_engine)
-    session = SessionLocal()
+    """Provide a DB session whose work is rolled back after each test.
+
+    Commits made by the test or the app only release a SAVEPOINT inside
+    the outer transaction, so every test starts from an empty schema.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def session_client():
+    """One TestClient per run, so app startup/shutdown happens only once."""
+    with TestClient(app) as c:
+        yield c
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Remove the app's temp database directory once the run is over."""
+    shutil.rmtree(_APP_DB_DIR, ignore_errors=True)
 
 
 @pytest.fixture
-def client(db):
-    """FastAPI TestClient with DB dependency override."""
+def override_db(db):
+    """Point the app's get_db dependency at this test's session."""
     def override_get_db():
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as c:
-        yield c
+    yield db
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def client(session_client, override_db):
+    """FastAPI TestClient with DB dependency override."""
+    return session_client
+
+
 # --- Factory Fixtures ---
 
 @pytest.fixture
@@ -110,6 +154,28 @@ def make_sentence(db):
     return _make
 
 
+@pytest.fixture
+def make_sentences(db):
+    """Factory to insert several Sentences in one batch; returns their IDs."""
+    def _make(project_id, rows):
+        mappings = [
+            {
+                "id": str(uuid.uuid4()),
+                "project_id": project_id,
+                "idx": idx,
+                "text": text,
+                "start_time": idx * 2.5,
+                "end_time": idx * 2.5 + 2.5,
+                "is_difficult": is_difficult,
+            }
+            for idx, text, is_difficult in rows
+        ]
+        db.bulk_insert_mappings(Sentence, mappings)
+        db.commit()
+        return [m["id"] for m in mappings]
+    return _make
+
+
 @pytest.fixture
 def make_keyword(db):
     """Factory to create and persist a Keyword."""
@@ -0,0 +1,77 @@
+"""Tests for desktop/app/services/assemblyai_transcriber.py."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.assemblyai_transcriber import AssemblyAITranscriber
+
+
+def _word(text: str, start_ms: int, end_ms: int) -> SimpleNamespace:
+    return SimpleNamespace(text=text, start=start_ms, end=end_ms)
+
+
+def _utterance(text: str, start_ms: int, end_ms: int, speaker: str) -> SimpleNamespace:
+    return SimpleNamespace(text=text, start=start_ms, end=end_ms, speaker=speaker)
+
+
+class TestParseTranscript:
+    """Tests for mapping AssemblyAI words onto utterances."""
+
+    @pytest.fixture
+    def transcriber(self):
+        return AssemblyAITranscriber(api_key="test-key")
+
+    def test_words_assigned_to_utterances_by_time(self, transcriber):
+        transcript = SimpleNamespace(
+            words=[
+                _word("Hallo", 0, 400),
+                _word("daar.", 450, 900),
+                _word("Goedemorgen", 1200, 1800),
+                _word("Jan.", 1850, 2200),
+            ],
+            utterances=[
+                _utterance("Hallo daar.", 0, 900, "A"),
+                _utterance("Goedemorgen Jan.", 1200, 2200, "B"),
+            ],
+        )
+
+        result = transcriber._parse_transcript(transcript)
+
+        assert [[w.text for w in u.words] for u in result.utterances] == [
+            ["Hallo", "daar."],
+            ["Goedemorgen", "Jan."],
+        ]
+        assert [s.label for s in result.speakers] == ["A", "B"]
+
+    def test_word_overrunning_utterance_end_is_dropped(self, transcriber):
+        transcript = SimpleNamespace(
+            words=[
+                _word("Ja", 0, 300),
+                _word("nee", 350, 1500),  # ends well past the utterance
+            ],
+            utterances=[_utterance("Ja nee", 0, 1000, "A")],
+        )
+
+        result = transcriber._parse_transcript(transcript)
+
+        assert [w.text for w in result.utterances[0].words] == ["Ja"]
+
+    def test_boundary_tolerance_and_unsorted_words(self, transcriber):
+        transcript = SimpleNamespace(
+            words=[
+                _word("twee", 1005, 1400),  # starts 5 ms before the utterance
+                _word("een", 0, 500),
+            ],
+            utterances=[
+                _utterance("een", 0, 500, "A"),
+                _utterance("twee", 1010, 1400, "B"),
+            ],
+        )
+
+        result = transcriber._parse_transcript(transcript)
+
+        assert [[w.text for w in u.words] for u in result.utterances] == [
+            ["een"],
+            ["twee"],
+        ]
@@ -0,0 +1,39 @@
+"""Tests for scripts/convert_freedict.py."""
+
+import lzma
+import os
+import sys
+import tarfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+import convert_freedict  # noqa: E402
+
+
+class TestFetchTeiFile:
+    """Tests for fetch_tei_file."""
+
+    def test_non_tar_download_raises(self, tmp_path):
+        """An xz stream that is not a tar archive should raise, not hang."""
+        # Incompressible, so the download is larger than the pipe buffers
+        # on both sides of the xz process
+        archive = tmp_path / "not-a-tar.tar.xz"
+        archive.write_bytes(lzma.compress(os.urandom(4 * 1024 * 1024)))
+
+        errors = []
+
+        def fetch():
+            try:
+                convert_freedict.fetch_tei_file(archive.as_uri(), str(tmp_path))
+            except Exception as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=fetch, daemon=True)
+        worker.start()
+        worker.join(timeout=30)
+
+        assert not worker.is_alive(), "fetch_tei_file hung on a non-tar download"
+        assert len(errors) == 1
+        assert isinstance(errors[0], tarfile.ReadError)
@@ -5,6 +5,7 @@ import json
 import uuid
 
 import pytest
+from sqlalchemy import func, select
 
 from app.models import Project, Sentence, Keyword, Speaker
 
@@ -183,14 +184,14 @@ class TestCascadeDeletes:
         make_sentence(project.id, idx=1)
         db.delete(project)
         db.commit()
-        assert db.query(Sentence).count() == 0
+        assert db.scalar(select(func.count()).select_from(Sentence)) == 0
 
     def test_delete_project_cascades_speakers(self, db, make_project, make_speaker):
         project = make_project()
         make_speaker(project.id, label="A")
         db.delete(project)
         db.commit()
-        assert db.query(Speaker).count() == 0
+        assert db.scalar(select(func.count()).select_from(Speaker)) == 0
 
     def test_delete_sentence_cascades_keywords(self, db, make_project, make_sentence, make_keyword):
         project = make_project()
@@ -198,4 +199,4 @@ class TestCascadeDeletes:
         make_keyword(sentence.id)
         db.delete(sentence)
         db.commit()
-        assert db.query(Keyword).count() == 0
+        assert db.scalar(select(func.count()).select_from(Keyword)) == 0
@@ -2,13 +2,61 @@
 
 import json
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import mock_open, patch
 
 import pytest
 
 from app.services.progress_merger import ProgressMerger, merge_progress_files
 
 
+def _proj(*sentences):
+    """Build a minimal project export containing the given sentences."""
+    return {
+        "id": "p1",
+        "name": "Test",
+        "sentences": list(sentences),
+        "keywords": [],
+        "progress": {},
+    }
+
+
+# (field, local value, remote value, expected merged value)
+SENTENCE_FIELD_CASES = [
+    ("learn_count", 3, 5, 5),
+    ("learn_count", 7, 2, 7),
+    ("learn_count", None, 3, 3),
+    ("learned", False, True, True),
+    ("learned", False, False, False),
+    ("is_difficult", True, False, True),
+    ("is_difficult", False, True, True),
+    ("is_difficult", False, False, False),
+    ("review_count", 3, 7, 7),
+    ("review_count", None, 2, 2),
+    ("last_reviewed", "2026-01-10T08:00:00", "2026-01-15T10:00:00", "2026-01-15T10:00:00"),
+    ("last_reviewed", "2026-01-20T08:00:00", "2026-01-15T10:00:00", "2026-01-20T08:00:00"),
+    ("last_reviewed", None, "2026-01-15T10:00:00", "2026-01-15T10:00:00"),
+    ("last_reviewed", None, None, None),
+]
+
+# Explicit IDs keep pytest from repr()-ing each case during collection
+SENTENCE_FIELD_IDS = [
+    "learn_count_prefers_higher",
+    "learn_count_local_wins",
+    "learn_count_none_is_zero",
+    "learned_is_or",
+    "learned_both_false",
+    "is_difficult_local_true",
+    "is_difficult_remote_true",
+    "is_difficult_both_false",
+    "review_count_takes_max",
+    "review_count_none_is_zero",
+    "last_reviewed_takes_latest",
+    "last_reviewed_local_later",
+    "last_reviewed_one_none",
+    "last_reviewed_both_none",
+]
+
+
 class TestProgressMerger:
     """Tests for the ProgressMerger class."""
 
@@ -19,51 +67,19 @@ class TestProgressMerger:
 
     # --- Sentence merging ---
 
-    def test_merge_prefers_higher_learn_count(self, merger):
-        """Remote has higher learn_count; merged result should take the max."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "learn_count": 3, "order": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "learn_count": 5, "order": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
+    @pytest.mark.parametrize(
+        "field,local_value,remote_value,expected",
+        SENTENCE_FIELD_CASES,
+        ids=SENTENCE_FIELD_IDS,
+    )
+    def test_merge_sentence_field(self, merger, field, local_value, remote_value, expected):
+        """Per-sentence progress fields merge by max / OR / latest timestamp."""
+        local = _proj({"id": "s1", "text": "Hallo", field: local_value, "index": 0})
+        remote = _proj({"id": "s1", "text": "Hallo", field: remote_value, "index": 0})
         result = merger.merge(local, remote)
-        assert result["sentences"][0]["learn_count"] == 5
-
-    def test_merge_local_wins_when_higher(self, merger):
-        """Local has higher learn_count; merged result should keep local value."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "learn_count": 7, "order": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "learn_count": 2, "order": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["learn_count"] == 7
+        assert result["sentences"][0][field] == expected
+        if isinstance(expected, bool) or expected is None:
+            assert result["sentences"][0][field] is expected
 
     def test_merge_keeps_local_only_sentences(self, merger):
         """Sentences only in local should appear in merged output."""
@@ -110,52 +126,6 @@ class TestProgressMerger:
         assert result["sentences"][0]["text"] == "Remote only"
         assert result["sentences"][0]["learn_count"] == 4
 
-    def test_merge_learned_flag_is_or(self, merger):
-        """If either side marks a sentence as learned, merged should be True."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "learned": False, "learn_count": 1, "order": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "learned": True, "learn_count": 3, "order": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["learned"] is True
-
-    def test_merge_learned_both_false(self, merger):
-        """If neither side marks learned, result should be False."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "learned": False, "learn_count": 0, "order": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "learned": False, "learn_count": 0, "order": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["learned"] is False
-
     def test_merge_sentences_sorted_by_order(self, merger):
         """Merged sentences should be sorted by the 'index' field."""
         local = {
@@ -181,242 +151,6 @@ class TestProgressMerger:
         assert len(result["sentences"]) == 3
         assert [s["id"] for s in result["sentences"]] == ["s1", "s2", "s3"]
 
-    def test_merge_sentence_none_learn_count_treated_as_zero(self, merger):
-        """A None learn_count should be treated as 0."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "learn_count": None, "order": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "learn_count": 3, "order": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["learn_count"] == 3
-
-    # --- is_difficult merging ---
-
-    def test_merge_is_difficult_or_local_true(self, merger):
-        """If local marks difficult but remote does not, result should be True."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "is_difficult": True, "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "is_difficult": False, "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["is_difficult"] is True
-
-    def test_merge_is_difficult_or_remote_true(self, merger):
-        """If remote marks difficult but local does not, result should be True."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "is_difficult": False, "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "is_difficult": True, "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["is_difficult"] is True
-
-    def test_merge_is_difficult_both_false(self, merger):
-        """If neither side marks difficult, result should be False."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "is_difficult": False, "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "is_difficult": False, "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["is_difficult"] is False
-
-    # --- review_count merging ---
-
-    def test_merge_review_count_takes_max(self, merger):
-        """review_count should take the higher value from either side."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "review_count": 3, "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "review_count": 7, "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["review_count"] == 7
-
-    def test_merge_review_count_none_treated_as_zero(self, merger):
-        """A None review_count should be treated as 0."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "review_count": None, "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "review_count": 2, "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["review_count"] == 2
-
-    # --- last_reviewed merging ---
-
-    def test_merge_last_reviewed_takes_latest(self, merger):
-        """last_reviewed should take the more recent timestamp."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "last_reviewed": "2026-01-10T08:00:00", "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "last_reviewed": "2026-01-15T10:00:00", "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["last_reviewed"] == "2026-01-15T10:00:00"
-
-    def test_merge_last_reviewed_local_wins_when_later(self, merger):
-        """last_reviewed should prefer local when it is more recent."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "last_reviewed": "2026-01-20T08:00:00", "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "last_reviewed": "2026-01-15T10:00:00", "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["last_reviewed"] == "2026-01-20T08:00:00"
-
-    def test_merge_last_reviewed_one_none(self, merger):
-        """When only one side has last_reviewed, it should be used."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "last_reviewed": None, "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "last_reviewed": "2026-01-15T10:00:00", "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["last_reviewed"] == "2026-01-15T10:00:00"
-
-    def test_merge_last_reviewed_both_none(self, merger):
-        """When both sides have no last_reviewed, result should be None."""
-        local = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        remote = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [
-                {"id": "s1", "text": "Hallo", "index": 0},
-            ],
-            "keywords": [],
-            "progress": {},
-        }
-        result = merger.merge(local, remote)
-        assert result["sentences"][0]["last_reviewed"] is None
-
     # --- Keyword merging ---
 
     def test_merge_keywords_prefers_local(self, merger):
@@ -968,33 +702,24 @@ class TestMergeProgressFiles:
         written = json.loads(output_path.read_text())
         assert written["sentences"][0]["learn_count"] == 5
 
-    def test_output_file_contains_valid_json(self, tmp_path):
+    def test_output_file_contains_valid_json(self):
         """The output file should contain valid JSON that can be loaded back."""
-        local_data = {
+        data = {
             "id": "p1",
             "name": "Test",
             "sentences": [],
             "keywords": [],
             "progress": {},
         }
-        remote_data = {
-            "id": "p1",
-            "name": "Test",
-            "sentences": [],
-            "keywords": [],
-            "progress": {},
-        }
-
-        local_path = tmp_path / "local.json"
-        remote_path = tmp_path / "remote.json"
-        output_path = tmp_path / "merged.json"
-
-        local_path.write_text(json.dumps(local_data))
-        remote_path.write_text(json.dumps(remote_data))
 
-        merge_progress_files(str(local_path), str(remote_path), str(output_path))
+        # Both inputs are identical, so one in-memory file serves every read
+        m = mock_open(read_data=json.dumps(data))
+        with patch("builtins.open", m):
+            merge_progress_files("local.json", "remote.json", "merged.json")
 
-        loaded = json.loads(output_path.read_text())
+        m.assert_any_call("merged.json", "w", encoding="utf-8")
+        written = "".join(call.args[0] for call in m().write.call_args_list)
+        loaded = json.loads(written)
         assert loaded["id"] == "p1"
         assert loaded["name"] == "Test"
         assert "sentences" in loaded
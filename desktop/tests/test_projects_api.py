@@ -1,12 +1,22 @@
 # desktop/tests/test_projects_api.py
 """Integration tests for /api/projects endpoints."""
 
-import json
-import uuid
-
+import orjson
 import pytest
+from sqlalchemy import func, select
+
+from app.models import Project, Sentence
+
 
-from app.models import Project, Sentence, Keyword, Speaker
+# Any well-formed ID that no fixture creates; avoids a uuid4() per 404 test.
+# The routes only check existence, so one constant covers projects,
+# speakers and sentences alike.
+_MISSING_ID = "00000000-0000-0000-0000-000000000000"
+
+
+def _j(response):
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(response.content)
 
 
 class TestListProjects:
@@ -16,7 +26,7 @@ class TestListProjects:
         """Empty database should return empty projects list."""
         response = client.get("/api/projects")
         assert response.status_code == 200
-        assert response.json()["projects"] == []
+        assert _j(response)["projects"] == []
 
     def test_returns_projects(self, client, make_project):
         """Should return all projects."""
@@ -24,14 +34,14 @@ class TestListProjects:
         make_project(name="Project B")
         response = client.get("/api/projects")
         assert response.status_code == 200
-        assert len(response.json()["projects"]) == 2
+        assert len(_j(response)["projects"]) == 2
 
     def test_project_list_item_fields(self, client, make_project):
         """Each item in the list should have the expected fields."""
         make_project(name="Test", status="ready")
         response = client.get("/api/projects")
         assert response.status_code == 200
-        item = response.json()["projects"][0]
+        item = _j(response)["projects"][0]
         assert "id" in item
         assert item["name"] == "Test"
         assert item["status"] == "ready"
@@ -48,7 +58,7 @@ class TestGetProject:
         make_sentence(project.id, idx=0, text="Hallo")
         response = client.get(f"/api/projects/{project.id}")
         assert response.status_code == 200
-        data = response.json()
+        data = _j(response)
         assert data["name"] == "Test"
         assert len(data["sentences"]) == 1
         assert data["sentences"][0]["text"] == "Hallo"
@@ -59,13 +69,13 @@ class TestGetProject:
         make_speaker(project.id, label="A", display_name="Jan")
         response = client.get(f"/api/projects/{project.id}")
         assert response.status_code == 200
-        data = response.json()
+        data = _j(response)
         assert len(data["speakers"]) == 1
         assert data["speakers"][0]["label"] == "A"
 
     def test_not_found(self, client):
         """Should return 404 for nonexistent project."""
-        response = client.get(f"/api/projects/{uuid.uuid4()}")
+        response = client.get(f"/api/projects/{_MISSING_ID}")
         assert response.status_code == 404
 
 
@@ -77,7 +87,7 @@ class TestDeleteProject:
         project = make_project()
         response = client.delete(f"/api/projects/{project.id}")
         assert response.status_code == 200
-        assert db.query(Project).count() == 0
+        assert db.scalar(select(func.count()).select_from(Project)) == 0
 
     def test_delete_cascades_sentences(self, client, db, make_project, make_sentence):
         """Deleting a project should also delete its sentences."""
@@ -85,38 +95,41 @@ class TestDeleteProject:
         make_sentence(project.id, idx=0)
         response = client.delete(f"/api/projects/{project.id}")
         assert response.status_code == 200
-        assert db.query(Sentence).count() == 0
+        assert db.scalar(select(func.count()).select_from(Sentence)) == 0
 
     def test_delete_not_found(self, client):
         """Should return 404 for nonexistent project."""
-        response = client.delete(f"/api/projects/{uuid.uuid4()}")
+        response = client.delete(f"/api/projects/{_MISSING_ID}")
         assert response.status_code == 404
 
 
 class TestGetProjectStatus:
     """Tests for GET /api/projects/{id}/status."""
 
-    def test_status_transcribing(self, client, make_project):
-        """Should return correct status and progress for transcribing state."""
-        project = make_project(status="transcribing")
+    @pytest.mark.parametrize(
+        "status,progress",
+        [
+            ("pending", 0),
+            ("extracting", 10),
+            ("transcribing", 30),
+            ("identifying", 40),
+            ("explaining", 95),
+            ("ready", 100),
+            ("error", 0),
+        ],
+    )
+    def test_status(self, client, make_project, status, progress):
+        """Should return the status and its stage progress percentage."""
+        project = make_project(status=status)
         response = client.get(f"/api/projects/{project.id}/status")
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "transcribing"
-        assert data["progress"] == 30
-
-    def test_status_ready(self, client, make_project):
-        """Ready project should show 100% progress."""
-        project = make_project(status="ready")
-        response = client.get(f"/api/projects/{project.id}/status")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ready"
-        assert data["progress"] == 100
+        data = _j(response)
+        assert data["status"] == status
+        assert data["progress"] == progress
 
     def test_status_not_found(self, client):
         """Should return 404 for nonexistent project."""
-        response = client.get(f"/api/projects/{uuid.uuid4()}/status")
+        response = client.get(f"/api/projects/{_MISSING_ID}/status")
         assert response.status_code == 404
 
 
@@ -130,11 +143,11 @@ class TestSpeakerEndpoints:
         make_speaker(project.id, label="B", display_name="Piet")
         response = client.get(f"/api/projects/{project.id}/speakers")
         assert response.status_code == 200
-        assert len(response.json()["speakers"]) == 2
+        assert len(_j(response)["speakers"]) == 2
 
     def test_get_speakers_not_found(self, client):
         """Should return 404 for nonexistent project."""
-        response = client.get(f"/api/projects/{uuid.uuid4()}/speakers")
+        response = client.get(f"/api/projects/{_MISSING_ID}/speakers")
         assert response.status_code == 404
 
     def test_update_speaker_name(self, client, db, make_project, make_speaker):
@@ -146,7 +159,7 @@ class TestSpeakerEndpoints:
             json={"name": "Jan de Vries"},
         )
         assert response.status_code == 200
-        data = response.json()
+        data = _j(response)
         assert data["speaker"]["display_name"] == "Jan de Vries"
         assert data["speaker"]["is_manual"] is True
 
@@ -154,7 +167,7 @@ class TestSpeakerEndpoints:
         """Should return 404 for nonexistent speaker."""
         project = make_project()
         response = client.put(
-            f"/api/projects/{project.id}/speakers/{uuid.uuid4()}",
+            f"/api/projects/{project.id}/speakers/{_MISSING_ID}",
             json={"name": "Nobody"},
         )
         assert response.status_code == 404
@@ -171,7 +184,7 @@ class TestExportProject:
 
         response = client.get(f"/api/projects/{project.id}/export")
         assert response.status_code == 200
-        data = response.json()
+        data = _j(response)
         assert data["project"]["name"] == "Export Test"
         assert len(data["sentences"]) == 1
         assert len(data["sentences"][0]["keywords"]) == 1
@@ -182,13 +195,13 @@ class TestExportProject:
         project = make_project(name="V Test", status="ready")
         response = client.get(f"/api/projects/{project.id}/export")
         assert response.status_code == 200
-        data = response.json()
+        data = _j(response)
         assert data["version"] == "1.0"
         assert "exported_at" in data
 
     def test_export_not_found(self, client):
         """Should return 404 for nonexistent project."""
-        response = client.get(f"/api/projects/{uuid.uuid4()}/export")
+        response = client.get(f"/api/projects/{_MISSING_ID}/export")
         assert response.status_code == 404
 
     def test_export_content_disposition(self, client, make_project):
@@ -213,7 +226,7 @@ class TestDifficultSentenceEndpoints:
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = _j(response)
         assert data["success"] is True
         assert data["is_difficult"] is True
 
@@ -222,46 +235,42 @@ class TestDifficultSentenceEndpoints:
         project = make_project()
         sentence = make_sentence(project.id, idx=0, text="Dit is moeilijk")
 
-        # Set is_difficult=True directly in the database first
+        # Set is_difficult=True directly; get_db is overridden with this same
+        # session, so a flush is enough for the endpoint to see it
         sentence.is_difficult = True
-        db.commit()
+        db.flush()
 
         response = client.put(
             f"/api/projects/{project.id}/sentences/{sentence.id}/difficult"
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = _j(response)
         assert data["success"] is True
         assert data["is_difficult"] is False
 
     def test_toggle_difficult_not_found(self, client, make_project):
         """PUT toggle endpoint should return 404 for nonexistent sentence."""
         project = make_project()
-        fake_id = str(uuid.uuid4())
-
         response = client.put(
-            f"/api/projects/{project.id}/sentences/{fake_id}/difficult"
+            f"/api/projects/{project.id}/sentences/{_MISSING_ID}/difficult"
         )
 
         assert response.status_code == 404
 
-    def test_get_difficult_sentences(self, client, db, make_project, make_sentence):
+    def test_get_difficult_sentences(self, client, make_project, make_sentences):
         """GET difficult endpoint should return only sentences marked as difficult."""
         project = make_project()
-        s1 = make_sentence(project.id, idx=0, text="Makkelijk")
-        s2 = make_sentence(project.id, idx=1, text="Moeilijk een")
-        s3 = make_sentence(project.id, idx=2, text="Moeilijk twee")
-
-        # Mark only s2 and s3 as difficult
-        s2.is_difficult = True
-        s3.is_difficult = True
-        db.commit()
+        make_sentences(project.id, [
+            (0, "Makkelijk", False),
+            (1, "Moeilijk een", True),
+            (2, "Moeilijk twee", True),
+        ])
 
         response = client.get(f"/api/projects/{project.id}/difficult")
 
         assert response.status_code == 200
-        data = response.json()
+        data = _j(response)
         assert len(data["sentences"]) == 2
         texts = {s["text"] for s in data["sentences"]}
         assert texts == {"Moeilijk een", "Moeilijk twee"}
@@ -274,7 +283,7 @@ class TestDifficultSentenceEndpoints:
         response = client.get(f"/api/projects/{project.id}/difficult")
 
         assert response.status_code == 200
-        data = response.json()
+        data = _j(response)
         assert data["sentences"] == []
 
     def test_record_review(self, client, make_project, make_sentence):
@@ -287,7 +296,7 @@ class TestDifficultSentenceEndpoints:
             f"/api/projects/{project.id}/sentences/{sentence.id}/review"
         )
         assert response1.status_code == 200
-        data1 = response1.json()
+        data1 = _j(response1)
         assert data1["success"] is True
         assert data1["review_count"] == 1
 
@@ -296,17 +305,15 @@ class TestDifficultSentenceEndpoints:
             f"/api/projects/{project.id}/sentences/{sentence.id}/review"
         )
         assert response2.status_code == 200
-        data2 = response2.json()
+        data2 = _j(response2)
         assert data2["success"] is True
         assert data2["review_count"] == 2
 
     def test_record_review_not_found(self, client, make_project):
         """POST review endpoint should return 404 for nonexistent sentence."""
         project = make_project()
-        fake_id = str(uuid.uuid4())
-
         response = client.post(
-            f"/api/projects/{project.id}/sentences/{fake_id}/review"
+            f"/api/projects/{project.id}/sentences/{_MISSING_ID}/review"
         )
 
         assert response.status_code == 404
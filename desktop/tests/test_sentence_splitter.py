@@ -8,12 +8,11 @@ from app.services.sentence_splitter import SentenceSplitter
 
 def _make_words(text: str, start: float = 0.0, word_duration: float = 0.3) -> list[WordTimestamp]:
     """Helper: create WordTimestamp list from text, evenly spaced."""
-    words = []
-    t = start
-    for w in text.split():
-        words.append(WordTimestamp(text=w, start=round(t, 3), end=round(t + word_duration, 3)))
-        t += word_duration + 0.05  # small gap between words
-    return words
+    step = word_duration + 0.05  # small gap between words
+    return [
+        WordTimestamp(w, round(start + i * step, 3), round(start + i * step + word_duration, 3))
+        for i, w in enumerate(text.split())
+    ]
 
 
 def _make_utterance(text: str, start: float = 0.0, speaker: str = "A") -> UtteranceInfo:
@@ -45,10 +44,18 @@ def _make_utterance_with_fewer_words(
 class TestSentenceSplitter:
     """Tests for the SentenceSplitter class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def splitter(self):
+        # Stateless between calls, so one instance serves the whole module
         return SentenceSplitter(max_words=10)  # Use 10 for easier testing
 
+    @pytest.fixture(scope="module")
+    def split_twelve_words(self, splitter):
+        """Two six-word sentences split once and shared (read-only) across tests."""
+        text = "Een twee drie vier vijf zes. Zeven acht negen tien elf twaalf."
+        utt = _make_utterance(text, start=5.0, speaker="B")
+        return utt, splitter.split_utterances([utt])
+
     # --- No splitting needed ---
 
     def test_short_utterance_unchanged(self, splitter):
@@ -71,30 +78,31 @@ class TestSentenceSplitter:
 
     # --- Sentence boundary splitting ---
 
-    def test_split_on_period(self, splitter):
-        """Should split on period followed by space and uppercase."""
-        text = "Een twee drie vier vijf zes. Zeven acht negen tien elf twaalf."
-        utt = _make_utterance(text)
-        result = splitter.split_utterances([utt])
-        assert len(result) == 2
-        assert result[0].text == "Een twee drie vier vijf zes."
-        assert result[1].text == "Zeven acht negen tien elf twaalf."
-
-    def test_split_on_question_mark(self, splitter):
-        """Should split on question mark followed by space and uppercase."""
-        text = "Wat is dat? Dat is een heel lang verhaal over Nederland."
-        utt = _make_utterance(text)
-        result = splitter.split_utterances([utt])
-        assert len(result) == 2
-        assert result[0].text == "Wat is dat?"
-
-    def test_split_on_exclamation(self, splitter):
-        """Should split on exclamation mark followed by uppercase."""
-        text = "Stop nu meteen! Ga niet verder met dat verhaal alstublieft."
+    @pytest.mark.parametrize(
+        "text,expected_first",
+        [
+            (
+                "Een twee drie vier vijf zes. Zeven acht negen tien elf twaalf.",
+                "Een twee drie vier vijf zes.",
+            ),
+            (
+                "Wat is dat? Dat is een heel lang verhaal over Nederland.",
+                "Wat is dat?",
+            ),
+            (
+                "Stop nu meteen! Ga niet verder met dat verhaal alstublieft.",
+                "Stop nu meteen!",
+            ),
+        ],
+        ids=["period", "question_mark", "exclamation"],
+    )
+    def test_split_on_terminal_punct(self, splitter, text, expected_first):
+        """Should split on . ? ! followed by space and uppercase."""
         utt = _make_utterance(text)
         result = splitter.split_utterances([utt])
         assert len(result) == 2
-        assert result[0].text == "Stop nu meteen!"
+        assert result[0].text == expected_first
+        assert result[1].text == text[len(expected_first) + 1:]
 
     def test_no_split_on_abbreviation(self, splitter):
         """Should NOT split on abbreviation periods (no uppercase after)."""
@@ -104,6 +112,13 @@ class TestSentenceSplitter:
         result = splitter.split_utterances([utt])
         assert len(result) == 1
 
+    def test_split_keeps_sentence_whitespace(self, splitter):
+        """Sentences that are not split further keep their original spacing."""
+        text = "Een  twee\tdrie vier. Vijf zes\nzeven acht."
+        utt = _make_utterance(text)
+        result = splitter.split_utterances([utt])
+        assert [r.text for r in result] == ["Een  twee\tdrie vier.", "Vijf zes\nzeven acht."]
+
     # --- Clause boundary splitting ---
 
     def test_split_on_comma_when_no_sentence_boundary(self, splitter):
@@ -181,30 +196,24 @@ class TestSentenceSplitter:
 
     # --- Timestamp precision ---
 
-    def test_split_preserves_original_start_end(self, splitter):
+    def test_split_preserves_original_start_end(self, split_twelve_words):
         """First segment should start at original start, last at original end."""
-        text = "Een twee drie vier vijf zes. Zeven acht negen tien elf twaalf."
-        utt = _make_utterance(text, start=5.0)
-        result = splitter.split_utterances([utt])
+        utt, result = split_twelve_words
         assert result[0].start == utt.start
         assert result[-1].end == utt.end
 
-    def test_split_timestamps_from_words(self, splitter):
+    def test_split_timestamps_from_words(self, split_twelve_words):
         """Split segments should get timestamps from their word boundaries."""
-        text = "Een twee drie vier vijf zes. Zeven acht negen tien elf twaalf."
-        utt = _make_utterance(text, start=5.0)
-        result = splitter.split_utterances([utt])
+        _, result = split_twelve_words
         assert len(result) == 2
         # Second segment start should be >= first segment end
         assert result[1].start >= result[0].end
 
     # --- Speaker preservation ---
 
-    def test_split_preserves_speaker_label(self, splitter):
+    def test_split_preserves_speaker_label(self, split_twelve_words):
         """All split segments should keep the original speaker label."""
-        text = "Een twee drie vier vijf zes. Zeven acht negen tien elf twaalf."
-        utt = _make_utterance(text, speaker="B")
-        result = splitter.split_utterances([utt])
+        _, result = split_twelve_words
         for r in result:
             assert r.speaker_label == "B"
 
@@ -220,11 +229,9 @@ class TestSentenceSplitter:
 
     # --- Words list carried through ---
 
-    def test_split_segments_have_words(self, splitter):
+    def test_split_segments_have_words(self, split_twelve_words):
         """Each split segment should have its own words list."""
-        text = "Een twee drie vier vijf zes. Zeven acht negen tien elf twaalf."
-        utt = _make_utterance(text)
-        result = splitter.split_utterances([utt])
+        _, result = split_twelve_words
         for r in result:
             assert len(r.words) > 0
             # Words text joined should roughly match segment text
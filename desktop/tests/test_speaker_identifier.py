@@ -64,6 +64,11 @@ class TestParseResponse:
         results = identifier._parse_response("not valid json {{{")
         assert results == {}
 
+    def test_handles_missing_content(self):
+        identifier = SpeakerIdentifier(api_key="test-key")
+        results = identifier._parse_response(None)
+        assert results == {}
+
     def test_handles_missing_speakers_key(self):
         identifier = SpeakerIdentifier(api_key="test-key")
         results = identifier._parse_response('{"other": "data"}')
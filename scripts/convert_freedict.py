@@ -8,70 +8,193 @@ Dutch language learning application.
 
 Output format:
 {
-    "word": {"pos": "part of speech", "en": "English translation"},
+    "word": {"pos": "part of speech", "en": ["English translation", ...]},
     ...
 }
 """
 
 import json
 import os
+import shutil
+import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
 import urllib.request
 from pathlib import Path
+from typing import BinaryIO
 from xml.etree import ElementTree as ET
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # FreeDict download URL (source tarball contains TEI XML)
 FREEDICT_URL = "https://download.freedict.org/dictionaries/nld-eng/0.2/freedict-nld-eng-0.2.src.tar.xz"
 
 # Output path (relative to project root)
 OUTPUT_FILE = "static/data/dictionary.json"
 
+# Qualified TEI tag names and paths (resolved once, not per lookup)
+TEI_NS = "{http://www.tei-c.org/ns/1.0}"
+TEI_ENTRY_TAG = TEI_NS + "entry"
+TEI_FORM_TAG = TEI_NS + "form"
+TEI_ORTH_TAG = TEI_NS + "orth"
+TEI_SENSE_TAG = TEI_NS + "sense"
+TEI_QUOTE_TAG = TEI_NS + "quote"
+TEI_GRAM_POS_PATH = f".//{TEI_NS}gram[@type='pos']"
+TEI_CIT_TRANS_PATH = f"{TEI_NS}cit[@type='trans']"
+
 
-def download_dictionary(url: str, dest_path: str) -> None:
+def extract_tei_member(tar: tarfile.TarFile, extract_dir: str) -> str:
     """
-    Download the FreeDict dictionary archive.
+    Extract the first .tei member from a streaming tar archive.
 
     Args:
-        url: URL to download from
-        dest_path: Local path to save the file
+        tar: Archive opened in streaming mode
+        extract_dir: Directory to extract the TEI file to
+
+    Returns:
+        Path to the extracted TEI XML file
     """
-    print(f"Downloading dictionary from {url}...")
-    urllib.request.urlretrieve(url, dest_path)
-    print(f"Downloaded to {dest_path}")
+    for member in tar:
+        if member.isfile() and member.name.endswith(".tei"):
+            tar.extract(member, extract_dir)
+            tei_path = os.path.join(extract_dir, member.name)
+            print(f"Found TEI file: {tei_path}")
+            return tei_path
+
+    raise FileNotFoundError("No .tei file found in archive")
+
+
+def pipe_stream(source: BinaryIO, sink: BinaryIO, errors: list) -> None:
+    """
+    Copy source into sink until EOF, then close sink (runs in a thread).
+
+    Args:
+        source: Stream to read from
+        sink: Stream to write to
+        errors: List that receives any exception raised while copying
+    """
+    try:
+        shutil.copyfileobj(source, sink)
+    except BrokenPipeError:
+        # The reader stopped early (TEI member found); nothing left to do
+        pass
+    except Exception as e:
+        errors.append(e)
+    finally:
+        try:
+            sink.close()
+        except BrokenPipeError:
+            pass
 
 
-def extract_tei_file(archive_path: str, extract_dir: str) -> str:
+def fetch_tei_file(url: str, extract_dir: str) -> str:
     """
-    Extract the TEI XML file from the tar.xz archive.
+    Download the FreeDict archive and extract its TEI XML file.
+
+    The HTTP response is streamed through an external `xz -d` process while
+    tarfile reads the decompressed output, so downloading, decompressing and
+    extracting run concurrently. The archive is never written to disk and
+    only the .tei member is extracted. Falls back to in-process
+    decompression when xz is not installed.
 
     Args:
-        archive_path: Path to the tar.xz archive
-        extract_dir: Directory to extract to
+        url: URL of the tar.xz archive
+        extract_dir: Directory to extract the TEI file to
 
     Returns:
         Path to the extracted TEI XML file
     """
-    print(f"Extracting archive...")
-    with tarfile.open(archive_path, "r:xz") as tar:
-        tar.extractall(extract_dir)
-
-    # Find the .tei file
-    for root, dirs, files in os.walk(extract_dir):
-        for f in files:
-            if f.endswith(".tei"):
-                tei_path = os.path.join(root, f)
-                print(f"Found TEI file: {tei_path}")
-                return tei_path
+    print(f"Downloading dictionary from {url}...")
+    xz_path = shutil.which("xz")
+
+    with urllib.request.urlopen(url) as response:
+        if xz_path is None:
+            with tarfile.open(fileobj=response, mode="r|xz") as tar:
+                return extract_tei_member(tar, extract_dir)
+
+        with subprocess.Popen(
+            [xz_path, "-d", "-c", "-T0"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        ) as xz:
+            errors = []
+            feeder = threading.Thread(
+                target=pipe_stream,
+                args=(response, xz.stdin, errors),
+                daemon=True,
+            )
+            feeder.start()
+            try:
+                with tarfile.open(fileobj=xz.stdout, mode="r|") as tar:
+                    return extract_tei_member(tar, extract_dir)
+            except (tarfile.TarError, FileNotFoundError):
+                # A failed download surfaces as a truncated archive. Stop xz
+                # before waiting for the feeder: if xz is still running, both
+                # can be blocked on full pipes.
+                xz.kill()
+                feeder.join()
+                if errors:
+                    raise errors[0]
+                raise
+            finally:
+                xz.kill()
+                feeder.join()
+
+
+def parse_entry(entry: ET.Element) -> tuple[str, str, list[str]] | None:
+    """
+    Extract headword, part of speech and translations from one TEI entry.
 
-    raise FileNotFoundError("No .tei file found in archive")
+    Args:
+        entry: A TEI <entry> element
+
+    Returns:
+        (word, pos, translations), or None if the entry has no headword
+        or no English translations
+    """
+    # Get the headword (orth element within form)
+    form = entry.find(TEI_FORM_TAG)
+    if form is None:
+        return None
+
+    orth = form.find(TEI_ORTH_TAG)
+    if orth is None or not orth.text:
+        return None
+
+    word = orth.text.strip().lower()
+
+    # Get part of speech (interned: only a handful of distinct values)
+    pos = ""
+    gram = entry.find(TEI_GRAM_POS_PATH)
+    if gram is not None and gram.text:
+        pos = sys.intern(gram.text.strip())
+
+    # Get English translation (from sense/cit/quote)
+    translations = []
+    for sense in entry.findall(TEI_SENSE_TAG):
+        for cit in sense.findall(TEI_CIT_TRANS_PATH):
+            quote = cit.find(TEI_QUOTE_TAG)
+            if quote is not None and quote.text:
+                translations.append(quote.text.strip())
+
+    if not translations:
+        return None
+
+    return word, pos, translations
 
 
 def parse_tei_dictionary(tei_path: str) -> dict:
     """
     Parse the TEI XML dictionary file.
 
+    Streams the file with iterparse and discards each entry once it has been
+    read, so memory stays flat instead of holding the whole DOM.
+
     Args:
         tei_path: Path to the TEI XML file
 
@@ -80,53 +203,37 @@ def parse_tei_dictionary(tei_path: str) -> dict:
     """
     print(f"Parsing TEI dictionary...")
 
-    # TEI namespace
-    ns = {"tei": "http://www.tei-c.org/ns/1.0"}
-
-    tree = ET.parse(tei_path)
-    root = tree.getroot()
-
     dictionary = {}
     entry_count = 0
 
-    # Find all entry elements
-    for entry in root.findall(".//tei:entry", ns):
-        # Get the headword (orth element within form)
-        form = entry.find("tei:form", ns)
-        if form is None:
+    # Open elements, so a finished entry can be detached from its parent
+    parents = []
+
+    for event, elem in ET.iterparse(tei_path, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
             continue
 
-        orth = form.find("tei:orth", ns)
-        if orth is None or not orth.text:
+        parents.pop()
+        if elem.tag != TEI_ENTRY_TAG:
             continue
 
-        word = orth.text.strip().lower()
-
-        # Get part of speech
-        pos = ""
-        gram = entry.find(".//tei:gram[@type='pos']", ns)
-        if gram is not None and gram.text:
-            pos = gram.text.strip()
-
-        # Get English translation (from sense/cit/quote)
-        translations = []
-        for sense in entry.findall("tei:sense", ns):
-            for cit in sense.findall("tei:cit[@type='trans']", ns):
-                quote = cit.find("tei:quote", ns)
-                if quote is not None and quote.text:
-                    translations.append(quote.text.strip())
-
-        if translations:
-            # Join multiple translations with semicolon
-            en_translation = "; ".join(translations)
-
-            # Store in dictionary (use first occurrence if duplicate)
-            if word not in dictionary:
-                dictionary[word] = {
-                    "pos": pos,
-                    "en": en_translation
-                }
-                entry_count += 1
+        parsed = parse_entry(elem)
+        if parents:
+            parents[-1].remove(elem)
+
+        if parsed is None:
+            continue
+
+        word, pos, translations = parsed
+
+        # Store in dictionary (use first occurrence if duplicate)
+        if word not in dictionary:
+            dictionary[word] = {
+                "pos": pos,
+                "en": translations
+            }
+            entry_count += 1
 
     print(f"Parsed {entry_count} dictionary entries")
     return dictionary
@@ -143,8 +250,13 @@ def save_dictionary(dictionary: dict, output_path: str) -> None:
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(dictionary, f, ensure_ascii=False, separators=(",", ":"))
+    if orjson is not None:
+        # orjson output is already compact and leaves non-ASCII unescaped
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(dictionary, option=orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(dictionary, f, ensure_ascii=False, separators=(",", ":"))
 
     # Get file size
     size_kb = os.path.getsize(output_path) / 1024
@@ -168,12 +280,8 @@ def main() -> int:
 
     try:
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Download archive
-            archive_path = os.path.join(temp_dir, "freedict-nld-eng.tar.xz")
-            download_dictionary(FREEDICT_URL, archive_path)
-
-            # Extract TEI file
-            tei_path = extract_tei_file(archive_path, temp_dir)
+            # Download archive and extract TEI file
+            tei_path = fetch_tei_file(FREEDICT_URL, temp_dir)
 
             # Parse dictionary
             dictionary = parse_tei_dictionary(tei_path)
@@ -187,8 +295,9 @@ def main() -> int:
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        if os.environ.get("DEBUG", "").lower() in ("1", "true", "yes"):
+            import traceback
+            traceback.print_exc()
         return 1
 
 
@@ -1,22 +1,121 @@
 #!/usr/bin/env python3
-"""Upload Dutch Learn projects to Google Drive."""
-
+"""
+Upload Dutch Learn projects to Google Drive.
+
+The OAuth token is stored as token.json. A token.pickle left by older
+versions is converted to token.json and deleted on the first run, so no
+re-auth is needed.
+"""
+
+import hashlib
+import json
+import logging
+import mimetypes
 import os
 import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaInMemoryUpload, MediaIoBaseUpload
+
+try:
+    from tqdm import tqdm
+except ImportError:  # optional: without it, progress is logged per file
+    tqdm = None
 
 # Scopes for Google Drive
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
 BASE_DIR = Path('/data/AI  Tools/Audio for Dutch Learn')
 CREDENTIALS_FILE = BASE_DIR / 'credentials.json'
-TOKEN_FILE = BASE_DIR / 'token.pickle'
+TOKEN_FILE = BASE_DIR / 'token.json'
+# Pickled token written by older versions, migrated to TOKEN_FILE
+LEGACY_TOKEN_FILE = BASE_DIR / 'token.pickle'
 EXPORT_DIR = BASE_DIR / 'export_for_drive'
 
+# Per-file upload log, used when a tqdm progress bar owns the console
+LOG_FILE = BASE_DIR / 'upload_to_drive.log'
+
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+# Query clauses selecting non-trashed folders / non-folder files
+FOLDER_QUERY = f"mimeType='{FOLDER_MIME_TYPE}' and trashed=false"
+FILE_QUERY = f"mimeType!='{FOLDER_MIME_TYPE}' and trashed=false"
+
+# Cached MD5s of exported files (inside EXPORT_DIR), keyed by relative path
+MANIFEST_NAME = '.upload_manifest.json'
+
+# Retries for transient Drive errors (5xx, 429, 403 rate limits); the client
+# sleeps with jittered exponential backoff between attempts
+MAX_RETRIES = 6
+
+# MIME types that must not depend on the platform's mimetypes database
+MIME_OVERRIDES = {
+    '.json': 'application/json',
+    '.mp3': 'audio/mpeg',
+}
+
+# Files up to this size go in a single multipart request instead of a
+# resumable session (which costs extra round-trips per file)
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
+# Chunk size for resumable uploads (Drive requires multiples of 256 KiB)
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Drive accepts at most this many calls in one batch request
+BATCH_LIMIT = 100
+
+# Files uploaded in parallel (Drive allows roughly 10 writes per second per user)
+UPLOAD_CONCURRENCY = int(os.environ.get('DRIVE_UPLOAD_CONCURRENCY', 6))
+
+# Write requests started per second (Drive allows about 10 per user)
+WRITE_RATE = float(os.environ.get('DRIVE_WRITE_RATE', 9.0))
+
+# Per-thread Drive service; the underlying httplib2.Http is not thread-safe
+_thread_local = threading.local()
+
+# Refresh the shared access token this long before it expires. This is ahead
+# of google-auth's own threshold, so workers never refresh it concurrently.
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+_refresh_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces requests to a steady rate."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared by all threads, so bursts stay under Drive's rate limit instead of
+# relying on backoff after 403 rateLimitExceeded responses
+write_limiter = TokenBucket(rate=WRITE_RATE, burst=max(1, int(WRITE_RATE)))
+
 
 def get_credentials():
     """Get or refresh OAuth credentials."""
@@ -24,8 +123,13 @@ def get_credentials():
 
     # Load existing token
     if TOKEN_FILE.exists():
-        with open(TOKEN_FILE, 'rb') as token:
+        creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
+    elif LEGACY_TOKEN_FILE.exists():
+        with open(LEGACY_TOKEN_FILE, 'rb') as token:
             creds = pickle.load(token)
+        save_token(creds)
+        # Don't leave a second copy of the refresh token in the pickle
+        LEGACY_TOKEN_FILE.unlink()
 
     # Refresh or get new credentials
     if not creds or not creds.valid:
@@ -37,81 +141,312 @@ def get_credentials():
             creds = flow.run_local_server(port=0)
 
         # Save token for next run
-        with open(TOKEN_FILE, 'wb') as token:
-            pickle.dump(creds, token)
+        save_token(creds)
 
+    ensure_fresh_token(creds)
     return creds
 
 
+def save_token(creds):
+    """Write credentials to TOKEN_FILE (it holds a refresh token: owner-only access)."""
+    fd = os.open(TOKEN_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as token:
+        token.write(creds.to_json())
+    os.chmod(TOKEN_FILE, 0o600)
+
+
+def ensure_fresh_token(creds):
+    """Refresh the access token if it expires within TOKEN_REFRESH_MARGIN."""
+    with _refresh_lock:
+        # google-auth keeps expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if creds.expiry and creds.expiry - now < TOKEN_REFRESH_MARGIN:
+            creds.refresh(Request())
+
+
+def quote_query_value(value):
+    """Escape a string for use inside single quotes in a Drive query."""
+    return value.replace('\\', '\\\\').replace("'", "\\'")
+
+
 def find_folder(service, folder_name, parent_id=None):
     """Find a folder by name in Google Drive."""
-    query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
+    query = f"name='{quote_query_value(folder_name)}' and {FOLDER_QUERY}"
     if parent_id:
-        query += f" and '{parent_id}' in parents"
+        query += f" and '{quote_query_value(parent_id)}' in parents"
 
     results = service.files().list(
         q=query,
         spaces='drive',
-        fields='files(id, name)'
-    ).execute()
+        fields='files(id)'
+    ).execute(num_retries=MAX_RETRIES)
 
     files = results.get('files', [])
     return files[0]['id'] if files else None
 
 
-def create_folder(service, folder_name, parent_id=None):
-    """Create a folder in Google Drive."""
+def list_all(service, query, file_fields):
+    """Run a files.list query and return the files from every result page."""
+    files = []
+    page_token = None
+
+    while True:
+        results = service.files().list(
+            q=query,
+            spaces='drive',
+            fields=f'nextPageToken, files({file_fields})',
+            pageSize=1000,
+            pageToken=page_token
+        ).execute(num_retries=MAX_RETRIES)
+
+        files.extend(results.get('files', []))
+
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            return files
+
+
+def list_folders(service, parent_id):
+    """List all folders directly under parent_id as a dict of name to ID."""
+    query = f"'{quote_query_value(parent_id)}' in parents and {FOLDER_QUERY}"
+    folders = {}
+    for folder in list_all(service, query, 'id, name'):
+        folders.setdefault(folder['name'], folder['id'])
+    return folders
+
+
+def list_files(service, parent_id):
+    """List the files directly under parent_id, grouped by name (Drive allows duplicates)."""
+    query = f"'{quote_query_value(parent_id)}' in parents and {FILE_QUERY}"
+    files = {}
+    for file in list_all(service, query, 'id, name, size, md5Checksum'):
+        files.setdefault(file['name'], []).append(file)
+    return files
+
+
+def folder_metadata(folder_name, parent_id=None):
+    """Build the Drive metadata for a new folder."""
     file_metadata = {
         'name': folder_name,
-        'mimeType': 'application/vnd.google-apps.folder'
+        'mimeType': FOLDER_MIME_TYPE
     }
     if parent_id:
         file_metadata['parents'] = [parent_id]
+    return file_metadata
+
 
+def create_folder(service, folder_name, parent_id=None):
+    """Create a folder in Google Drive."""
+    write_limiter.acquire()
     folder = service.files().create(
-        body=file_metadata,
+        body=folder_metadata(folder_name, parent_id),
         fields='id'
-    ).execute()
+    ).execute(num_retries=MAX_RETRIES)
 
     return folder.get('id')
 
 
-def upload_file(service, file_path, parent_id):
-    """Upload a file to Google Drive."""
+def create_folders(service, folder_names, parent_id):
+    """
+    Create several folders under parent_id with batch requests.
+
+    Returns a dict mapping folder name to ID. Calls that fail inside a batch
+    (e.g. rate limited) are retried one by one with create_folder.
+    """
+    folder_ids = {}
+    failed = []
+
+    def store_id(request_id, response, exception):
+        if exception is None:
+            folder_ids[request_id] = response['id']
+        else:
+            failed.append(request_id)
+
+    # Each call in a batch counts against the rate limit separately, and a
+    # batch reaches Drive all at once. Keep batches within the limiter's burst
+    # and take their tokens right before sending them.
+    batch_size = min(BATCH_LIMIT, write_limiter.capacity)
+    for start in range(0, len(folder_names), batch_size):
+        names = folder_names[start:start + batch_size]
+        batch = service.new_batch_http_request(callback=store_id)
+        for name in names:
+            batch.add(
+                service.files().create(body=folder_metadata(name, parent_id), fields='id'),
+                request_id=name
+            )
+        for _ in names:
+            write_limiter.acquire()
+        batch.execute()
+
+    for name in failed:
+        folder_ids[name] = create_folder(service, name, parent_id)
+
+    return folder_ids
+
+
+def scan_export_dir():
+    """
+    List the project folders in EXPORT_DIR and the files in each.
+
+    Uses os.scandir, whose entries answer is_dir()/is_file() from the
+    directory listing itself instead of a separate stat per path.
+    """
+    projects = {}
+    with os.scandir(EXPORT_DIR) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            with os.scandir(entry.path) as files:
+                projects[entry.name] = [f.path for f in files if f.is_file()]
+    return projects
+
+
+def load_manifest():
+    """Load the local MD5 manifest, or an empty one if there is none."""
+    try:
+        with open(EXPORT_DIR / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest):
+    """Write the local MD5 manifest."""
+    with open(EXPORT_DIR / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def file_md5(file_path, manifest):
+    """Get a file's MD5, reusing the manifest entry if size and mtime match."""
+    stat = os.stat(file_path)
+    key = os.path.relpath(file_path, EXPORT_DIR)
+    entry = manifest.get(key)
+    if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+        return entry['md5']
+
+    digest = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+
+    manifest[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'md5': digest.hexdigest()}
+    return manifest[key]['md5']
+
+
+def is_unchanged(file_path, remote_copies, manifest):
+    """Check whether any of the remote copies is identical to the local file."""
+    size = str(os.path.getsize(file_path))
+    candidates = [r for r in remote_copies if r.get('size') == size]
+    if not candidates:
+        return False
+    md5 = file_md5(file_path, manifest)
+    return any(r.get('md5Checksum') == md5 for r in candidates)
+
+
+def upload_file(service, file_path, parent_id, file_id=None):
+    """
+    Upload a file to Google Drive.
+
+    If file_id is given, that Drive file's content is replaced instead of
+    creating a new file next to it.
+    """
     file_name = os.path.basename(file_path)
 
     # Determine MIME type
-    if file_name.endswith('.json'):
-        mime_type = 'application/json'
-    elif file_name.endswith('.mp3'):
-        mime_type = 'audio/mpeg'
-    else:
-        mime_type = 'application/octet-stream'
+    ext = os.path.splitext(file_name)[1].lower()
+    mime_type = (
+        MIME_OVERRIDES.get(ext)
+        or mimetypes.guess_type(file_name)[0]
+        or 'application/octet-stream'
+    )
 
     file_metadata = {
         'name': file_name,
         'parents': [parent_id]
     }
 
-    media = MediaFileUpload(
-        file_path,
-        mimetype=mime_type,
-        resumable=True
-    )
+    write_limiter.acquire()
+    if os.path.getsize(file_path) <= RESUMABLE_THRESHOLD:
+        with open(file_path, 'rb') as f:
+            media = MediaInMemoryUpload(f.read(), mimetype=mime_type)
+
+        return upload_request(service, file_metadata, media, file_id).execute(
+            num_retries=MAX_RETRIES
+        )
+
+    # Large files: resumable upload streamed from disk one chunk at a time
+    with open(file_path, 'rb') as f:
+        # Let the kernel read the file ahead in the background so disk reads
+        # overlap with sending earlier chunks (not available on Windows/macOS)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+
+        media = MediaIoBaseUpload(
+            f,
+            mimetype=mime_type,
+            chunksize=UPLOAD_CHUNK_SIZE,
+            resumable=True
+        )
+        request = upload_request(service, file_metadata, media, file_id)
+
+        file = None
+        while file is None:
+            _, file = request.next_chunk(num_retries=MAX_RETRIES)
 
-    file = service.files().create(
+    return file
+
+
+def upload_request(service, file_metadata, media, file_id=None):
+    """Build the create request for a new file, or the update request for file_id."""
+    if file_id:
+        return service.files().update(
+            fileId=file_id,
+            media_body=media,
+            fields='id'
+        )
+    return service.files().create(
         body=file_metadata,
         media_body=media,
-        fields='id, name'
-    ).execute()
+        fields='id'
+    )
 
-    return file
+
+def build_service(creds):
+    """Build a Drive v3 service from the discovery document bundled with the client."""
+    return build('drive', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
+
+
+def get_thread_service(creds):
+    """Get the calling thread's Drive service, building it on first use."""
+    service = getattr(_thread_local, 'service', None)
+    if service is None:
+        service = build_service(creds)
+        _thread_local.service = service
+    return service
+
+
+def upload_file_in_worker(creds, file_path, parent_id, remote_files, manifest):
+    """
+    Upload a file using the worker thread's own Drive service.
+
+    Returns the uploaded file's metadata, or None if an identical copy is
+    already in the folder (per remote_files). A changed file replaces the
+    content of the remote copy with the same name.
+    """
+    remote_copies = remote_files.get(os.path.basename(file_path), [])
+    if is_unchanged(file_path, remote_copies, manifest):
+        return None
+
+    existing_id = remote_copies[0]['id'] if remote_copies else None
+    ensure_fresh_token(creds)
+    return upload_file(get_thread_service(creds), file_path, parent_id, existing_id)
 
 
 def main():
     print("Authenticating with Google Drive...")
     creds = get_credentials()
-    service = build('drive', 'v3', credentials=creds)
+    service = build_service(creds)
 
     # Find or create Dutch Learn folder
     print("Finding 'Dutch Learn' folder...")
@@ -123,24 +458,55 @@ def main():
 
     print(f"Dutch Learn folder ID: {dutch_learn_id}")
 
-    # Upload each project folder
-    for project_dir in EXPORT_DIR.iterdir():
-        if not project_dir.is_dir():
-            continue
-
-        project_name = project_dir.name
-        print(f"\nUploading project: {project_name}")
-
-        # Create project subfolder
-        project_folder_id = create_folder(service, project_name, dutch_learn_id)
-        print(f"  Created folder: {project_name}")
-
-        # Upload files in the project folder
-        for file_path in project_dir.iterdir():
-            if file_path.is_file():
-                print(f"  Uploading: {file_path.name}...", end=' ')
-                result = upload_file(service, str(file_path), project_folder_id)
-                print(f"Done (ID: {result['id']})")
+    # Reuse existing project subfolders and create the missing ones up front
+    projects = scan_export_dir()
+    folder_ids = list_folders(service, dutch_learn_id)
+    missing = [name for name in projects if name not in folder_ids]
+    print(f"Creating {len(missing)} project folder(s)...")
+    folder_ids.update(create_folders(service, missing, dutch_learn_id))
+    created = set(missing)
+
+    # Per-file progress goes to the log: a file when the progress bar is
+    # shown, otherwise the console
+    if tqdm is not None:
+        logging.basicConfig(filename=LOG_FILE, level=logging.INFO,
+                            format='%(asctime)s %(levelname)s %(message)s')
+        print(f"Uploading (details in {LOG_FILE})...")
+        progress = tqdm(total=sum(len(paths) for paths in projects.values()), unit='file')
+    else:
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+        progress = None
+
+    # Upload each project folder, skipping files Drive already has
+    manifest = load_manifest()
+    with ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY) as executor:
+        for project_name, file_paths in projects.items():
+            logger.info("Uploading project: %s", project_name)
+            project_folder_id = folder_ids[project_name]
+
+            # A folder created in this run is known to be empty
+            remote_files = {} if project_name in created else list_files(service, project_folder_id)
+
+            # Upload files in the project folder concurrently
+            futures = {
+                executor.submit(
+                    upload_file_in_worker, creds, file_path, project_folder_id,
+                    remote_files, manifest
+                ): os.path.basename(file_path)
+                for file_path in file_paths
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    logger.info("  Unchanged: %s", futures[future])
+                else:
+                    logger.info("  Uploaded: %s (ID: %s)", futures[future], result['id'])
+                if progress is not None:
+                    progress.update(1)
+
+    if progress is not None:
+        progress.close()
+    save_manifest(manifest)
 
     print("\n=== Upload complete! ===")
     print("You can now import the projects in the Dutch Learn app.")